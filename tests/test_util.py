@@ -240,6 +240,14 @@ def test_sizeof_fmt():
     assert util.sizeof_fmt(5000000) == "4.8MiB"
 
 
+def test_md5_file(runner):
+    with runner.isolated_filesystem():
+        open("empty.txt", "w").close()
+        open("file1.txt", "w").write("hello")
+        assert util.md5_file("empty.txt") == "1B2M2Y8AsgTpgAmY7PhCfg=="
+        assert util.md5_file("file1.txt") == "XUFAKrxLKna5cZ2REBfFkg=="
+
+
 def test_matplotlib_contains_images():
     """Ensures that the utility function can properly detect if immages are in a
     matplotlib figure"""
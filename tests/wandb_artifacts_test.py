@@ -134,6 +134,51 @@ def test_add_named_file(runner):
         }
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 3), reason="os.utime takes ns timestamps since py3.3"
+)
+def test_add_file_rewritten_same_size(runner):
+    with runner.isolated_filesystem():
+        open("file1.txt", "w").write("hello")
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_file("file1.txt", name="first.txt")
+        st = os.stat("file1.txt")
+        open("file1.txt", "w").write("world")
+        os.utime("file1.txt", ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert os.stat("file1.txt").st_mtime_ns == st.st_mtime_ns
+        artifact.add_file("file1.txt", name="second.txt")
+
+        manifest = artifact.manifest.to_manifest_json()
+        assert manifest["contents"]["first.txt"] == {
+            "digest": "XUFAKrxLKna5cZ2REBfFkg==",
+            "size": 5,
+        }
+        assert manifest["contents"]["second.txt"] == {
+            "digest": "fXkwN6B2AYZXSwKC8vQ15w==",
+            "size": 5,
+        }
+
+
+def test_add_file_twice_hashes_once(runner, mocker):
+    with runner.isolated_filesystem():
+        open("file1.txt", "w").write("hello")
+        md5_file = mocker.spy(util, "md5_file")
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_file("file1.txt", name="first.txt")
+        artifact.add_file("file1.txt", name="second.txt")
+
+        assert md5_file.call_count == 1
+        manifest = artifact.manifest.to_manifest_json()
+        assert manifest["contents"]["first.txt"] == {
+            "digest": "XUFAKrxLKna5cZ2REBfFkg==",
+            "size": 5,
+        }
+        assert manifest["contents"]["second.txt"] == {
+            "digest": "XUFAKrxLKna5cZ2REBfFkg==",
+            "size": 5,
+        }
+
+
 def test_add_new_file(runner):
     with runner.isolated_filesystem():
         artifact = wandb.Artifact(type="dataset", name="my-arty")
@@ -162,6 +207,97 @@ def test_add_dir(runner):
         }
 
 
+def test_add_dir_many_files(runner):
+    with runner.isolated_filesystem():
+        os.mkdir("nested")
+        for i in range(50):
+            open(os.path.join("nested", "file%d.txt" % i), "w").write("hello %d" % i)
+        open("file1.txt", "w").write("hello")
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_dir(".")
+
+        manifest = artifact.manifest.to_manifest_json()
+        assert len(manifest["contents"]) == 51
+        assert manifest["contents"]["file1.txt"] == {
+            "digest": "XUFAKrxLKna5cZ2REBfFkg==",
+            "size": 5,
+        }
+        for i in range(50):
+            path = os.path.join("nested", "file%d.txt" % i)
+            assert manifest["contents"][path]["digest"] == util.md5_file(path)
+
+
+def test_add_dir_mixed_sizes(runner):
+    with runner.isolated_filesystem():
+        # Large and small files interleaved, so the digests have to be put back
+        # in order after the large files are hashed first.
+        sizes = [10, 3 * 1024 * 1024, 0, 1024 * 1024, 7, 2 * 1024 * 1024 + 1, 300]
+        for i, size in enumerate(sizes):
+            open("file%d.bin" % i, "wb").write(bytes(bytearray([i + 1])) * size)
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_dir(".")
+
+        manifest = artifact.manifest.to_manifest_json()
+        assert len(manifest["contents"]) == len(sizes)
+        for i, size in enumerate(sizes):
+            path = "file%d.bin" % i
+            assert manifest["contents"][path] == {
+                "digest": util.md5_file(path),
+                "size": size,
+            }
+
+
+def test_add_dir_empty_file(runner):
+    with runner.isolated_filesystem():
+        open("empty.txt", "w").close()
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_dir(".")
+
+        manifest = artifact.manifest.to_manifest_json()
+        assert manifest["contents"]["empty.txt"] == {
+            "digest": "1B2M2Y8AsgTpgAmY7PhCfg==",
+            "size": 0,
+        }
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="symlinks need extra privileges on Windows"
+)
+def test_add_dir_follows_symlinks(runner):
+    with runner.isolated_filesystem():
+        os.makedirs(os.path.join("data", "real"))
+        os.mkdir("outside")
+        open(os.path.join("data", "real", "file1.txt"), "w").write("hello")
+        open(os.path.join("outside", "file2.txt"), "w").write("hello!")
+        os.symlink("real", os.path.join("data", "linked"))
+        os.symlink(os.path.join("real", "file1.txt"), os.path.join("data", "link.txt"))
+        os.symlink(os.path.abspath("outside"), os.path.join("data", "external"))
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_dir("data")
+
+        manifest = artifact.manifest.to_manifest_json()
+        expected = set()
+        for dirpath, _, filenames in os.walk("data", followlinks=True):
+            for fname in filenames:
+                expected.add(os.path.relpath(os.path.join(dirpath, fname), "data"))
+        assert set(manifest["contents"]) == expected
+        assert expected == {
+            os.path.join("real", "file1.txt"),
+            os.path.join("linked", "file1.txt"),
+            "link.txt",
+            os.path.join("external", "file2.txt"),
+        }
+        for path in [os.path.join("linked", "file1.txt"), "link.txt"]:
+            assert manifest["contents"][path] == {
+                "digest": "XUFAKrxLKna5cZ2REBfFkg==",
+                "size": 5,
+            }
+        assert manifest["contents"][os.path.join("external", "file2.txt")] == {
+            "digest": util.md5_file(os.path.join("outside", "file2.txt")),
+            "size": 6,
+        }
+
+
 def test_add_named_dir(runner):
     with runner.isolated_filesystem():
         open("file1.txt", "w").write("hello")
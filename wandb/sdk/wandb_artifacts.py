@@ -118,7 +118,7 @@ class Artifact(object):
         entry = ArtifactManifestEntry(
             name,
             None,
-            digest=md5_file_b64(local_path),
+            digest=md5_file_b64_cached(local_path),
             size=os.path.getsize(local_path),
             local_path=local_path,
         )
@@ -137,35 +137,39 @@ class Artifact(object):
         )
         start_time = time.time()
 
-        paths = []
-        for dirpath, _, filenames in os.walk(local_path, followlinks=True):
-            for fname in filenames:
-                physical_path = os.path.join(dirpath, fname)
-                logical_path = os.path.relpath(physical_path, start=local_path)
-                if name is not None:
-                    logical_path = os.path.join(name, logical_path)
-                paths.append((logical_path, physical_path))
-
-        def add_manifest_file(log_phy_path):
-            logical_path, physical_path = log_phy_path
+        # Every walked path starts with local_path, so slicing off the prefix is
+        # equivalent to (and much cheaper than) os.path.relpath.
+        prefix_len = len(os.path.join(local_path, ""))
+        name_prefix = os.path.join(name, "") if name is not None else ""
+        paths = [
+            (name_prefix + physical_path[prefix_len:], physical_path, size)
+            for physical_path, size in filesystem._iter_files(local_path)
+        ]
+
+        if local_path.startswith(self._artifact_dir.name):
+            # Objects written by add() were hashed when they were added, and
+            # files in our temp dir are never rewritten, so skip rehashing.
+            def is_known(logical_path, physical_path):
+                entry = self._manifest.get_entry_by_local_path(physical_path)
+                return entry is not None and entry.path == logical_path
+
+            paths = [path for path in paths if not is_known(path[0], path[1])]
+
+        digests = md5_files_b64(
+            [physical_path for _, physical_path, _ in paths],
+            sizes=[size for _, _, size in paths],
+        )
+        for (logical_path, physical_path, size), digest in zip(paths, digests):
             self._manifest.add_entry(
                 ArtifactManifestEntry(
                     logical_path,
                     None,
-                    digest=md5_file_b64(physical_path),
-                    size=os.path.getsize(physical_path),
+                    digest=digest,
+                    size=size,
                     local_path=physical_path,
                 )
             )
 
-        import multiprocessing.dummy  # this uses threads
-
-        NUM_THREADS = 8
-        pool = multiprocessing.dummy.Pool(NUM_THREADS)
-        pool.map(add_manifest_file, paths)
-        pool.close()
-        pool.join()
-
         termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
 
     def add_reference(self, uri, name=None, checksum=True, max_objects=None):
@@ -232,16 +236,25 @@ class Artifact(object):
         entry = self._manifest.get_entry_by_path(name)
         if entry is not None:
             return entry
-        with self.new_file(name) as f:
-            import json
+        import json
 
-            # TODO: Do we need to open with utf-8 codec?
-            f.write(json.dumps(obj.to_json(self), sort_keys=True))
+        # Serialize once, and reuse the result for both the file contents and
+        # its digest instead of reading the file back.
+        obj_bytes = json.dumps(val, sort_keys=True).encode()
+        with self.new_file(name, mode="wb") as f:
+            f.write(obj_bytes)
 
         # Note, we add the file from our temp directory.
-        # It will be added again later on finalize, but succeed since
-        # the checksum should match
-        entry = self.add_file(os.path.join(self._artifact_dir.name, name), name)
+        # finalize walks that directory again, but skips rehashing
+        # files that were already added here.
+        entry = ArtifactManifestEntry(
+            name,
+            None,
+            digest=base64.b64encode(hashlib.md5(obj_bytes).digest()).decode("ascii"),
+            size=len(obj_bytes),
+            local_path=os.path.join(self._artifact_dir.name, name),
+        )
+        self._manifest.add_entry(entry)
         self._added_objs[obj_id] = entry
 
         return entry
@@ -284,15 +297,11 @@ class Artifact(object):
                     self._artifact_dir.name
                 ):
                     return entry
-                rel_path = os.path.relpath(
-                    entry.local_path, start=self._artifact_dir.name
-                )
-                local_path = os.path.join(self._artifact_dir.name, rel_path)
                 cache_path, hit = self._cache.check_md5_obj_path(
                     entry.digest, entry.size
                 )
                 if not hit:
-                    shutil.copyfile(local_path, cache_path)
+                    shutil.copyfile(entry.local_path, cache_path)
                 entry.local_path = cache_path
 
             for entry in self._manifest.entries.values():
@@ -348,7 +357,10 @@ class ArtifactManifestV1(ArtifactManifest):
         contents.
         """
         contents = {}
-        for entry in sorted(self.entries.values(), key=lambda k: k.path):
+        # Entries are keyed by path, so sorting the keys directly orders them
+        # without a key function call per entry.
+        for path in sorted(self.entries):
+            entry = self.entries[path]
             json_entry = {
                 "digest": entry.digest,
             }
@@ -369,14 +381,29 @@ class ArtifactManifestV1(ArtifactManifest):
         }
 
     def digest(self):
-        hasher = hashlib.md5()
-        hasher.update("wandb-artifact-manifest-v1\n".encode())
-        for (name, entry) in sorted(self.entries.items(), key=lambda kv: kv[0]):
-            hasher.update("{}:{}\n".format(name, entry.digest).encode())
-        return hasher.hexdigest()
+        # Build the whole digest input up front and hash it with a single
+        # update, rather than formatting, encoding and hashing per entry.
+        entries = self.entries
+        lines = ["wandb-artifact-manifest-v1\n"]
+        lines.extend(
+            "{}:{}\n".format(name, entries[name].digest) for name in sorted(entries)
+        )
+        return hashlib.md5("".join(lines).encode()).hexdigest()
 
 
 class ArtifactManifestEntry(object):
+    # Manifests can hold a very large number of entries; slots keep each one
+    # small and make attribute access cheaper.
+    __slots__ = (
+        "path",
+        "ref",
+        "digest",
+        "birth_artifact_id",
+        "size",
+        "extra",
+        "local_path",
+    )
+
     def __init__(
         self,
         path,
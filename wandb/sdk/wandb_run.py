@@ -1300,6 +1300,9 @@ class Run(object):
 
     def _wait_for_finish(self):
         ret = None
+        # Start polling quickly so short runs don't wait a full interval to
+        # exit, and back off to the usual progress refresh rate.
+        poll_interval = 0.1
         while True:
             ret = self._backend.interface.communicate_poll_exit()
             logger.info("got exit ret: %s", ret)
@@ -1310,7 +1313,8 @@ class Run(object):
                 self._on_finish_progress(pusher_stats, done)
             if done:
                 break
-            time.sleep(2)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, 2)
         return ret
 
     def _on_finish(self):
@@ -13,20 +13,97 @@ def md5_string(string):
     return base64.b64encode(hash_md5.digest()).decode("ascii")
 
 
-def md5_hash_file(path):
-    hash_md5 = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(64 * 1024), b""):
-            hash_md5.update(chunk)
-    return hash_md5
+_EMPTY_FILE_MD5_B64 = "1B2M2Y8AsgTpgAmY7PhCfg=="
 
 
 def md5_file_b64(path):
-    return base64.b64encode(md5_hash_file(path).digest()).decode("ascii")
+    if os.path.getsize(path) == 0:
+        # Skip opening empty files, their digest is always the same.
+        return _EMPTY_FILE_MD5_B64
+    return util.md5_file(path)
+
+
+# Digests of files added to artifacts by this process, keyed by file identity,
+# size, mtime and ctime, so a file added under several names is only read once.
+# A rewrite that keeps the size and lands within the filesystem's timestamp
+# granularity is not noticed (on Windows st_ctime is the creation time, so it
+# doesn't help there). That's why this is only used when adding files;
+# verification always rereads the file.
+_md5_file_cache = {}
+
+_MD5_FILE_CACHE_MAX_SIZE = 65536
+
+
+def md5_file_b64_cached(path):
+    st = os.stat(path)
+    if st.st_size == 0:
+        return _EMPTY_FILE_MD5_B64
+    if not st.st_ino:
+        # Without inode numbers (Python 2 on Windows) files can't be told apart.
+        return util.md5_file(path)
+    key = (
+        st.st_dev,
+        st.st_ino,
+        st.st_size,
+        getattr(st, "st_mtime_ns", st.st_mtime),
+        getattr(st, "st_ctime_ns", st.st_ctime),
+    )
+    digest = _md5_file_cache.get(key)
+    if digest is None:
+        digest = util.md5_file(path)
+        if len(_md5_file_cache) >= _MD5_FILE_CACHE_MAX_SIZE:
+            _md5_file_cache.clear()
+        _md5_file_cache[key] = digest
+    return digest
 
 
 def md5_file_hex(path):
-    return md5_hash_file(path).hexdigest()
+    return util.md5_hash_file(path).hexdigest()
+
+
+# Files at least this big are hashed largest first, one per pool task.
+_MD5_FILES_LARGE_FILE_SIZE = 1024 * 1024
+
+
+def md5_files_b64(paths, sizes):
+    """Returns the base64 md5 of each file in `paths`, in the same order.
+
+    The files are hashed in parallel; hashlib releases the GIL while hashing,
+    so the thread pool is sized to the machine. Large files, going by `sizes`,
+    are started first and largest first so that a big file isn't left hashing
+    on its own at the end.
+    """
+    if not paths:
+        return []
+
+    import multiprocessing.dummy  # this uses threads
+
+    large = sorted(
+        (i for i in range(len(paths)) if sizes[i] >= _MD5_FILES_LARGE_FILE_SIZE),
+        key=lambda i: sizes[i],
+        reverse=True,
+    )
+    small = [i for i in range(len(paths)) if sizes[i] < _MD5_FILES_LARGE_FILE_SIZE]
+    num_threads = min(32, multiprocessing.cpu_count() + 4, len(paths))
+    pool = multiprocessing.dummy.Pool(num_threads)
+    try:
+        # One large file per task, otherwise map would hand several of them to
+        # the same worker in a single chunk. Small files are queued after them
+        # with the default chunking, which keeps the per-task overhead down.
+        large_result = pool.map_async(
+            md5_file_b64_cached, [paths[i] for i in large], chunksize=1
+        )
+        small_result = pool.map_async(md5_file_b64_cached, [paths[i] for i in small])
+        large_digests = large_result.get()
+        small_digests = small_result.get()
+    finally:
+        pool.close()
+        pool.join()
+
+    digests = [None] * len(paths)
+    for i, digest in zip(large + small, large_digests + small_digests):
+        digests[i] = digest
+    return digests
 
 
 def bytes_to_hex(bytestr):
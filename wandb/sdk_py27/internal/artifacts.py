@@ -4,7 +4,7 @@ import tempfile
 
 import wandb.filesync.step_prepare
 
-from ..interface.artifacts import ArtifactManifest
+from ..interface.artifacts import ArtifactManifest, md5_string
 
 
 def _manifest_json_from_proto(manifest):
@@ -133,10 +133,15 @@ class ArtifactSaver(object):
         )
 
         def before_commit():
-            with tempfile.NamedTemporaryFile("w+", suffix=".json", delete=False) as fp:
+            # Hash the serialized manifest directly rather than reading the
+            # temp file back; the file is only needed for the upload itself.
+            # No indent: json only uses its C encoder for compact output, and
+            # manifests can list many thousands of entries.
+            manifest_json = json.dumps(self._manifest.to_manifest_json())
+            digest = md5_string(manifest_json)
+            with tempfile.NamedTemporaryFile("wb", suffix=".json", delete=False) as fp:
                 path = os.path.abspath(fp.name)
-                json.dump(self._manifest.to_manifest_json(), fp, indent=4)
-            digest = wandb.util.md5_file(path)
+                fp.write(manifest_json.encode())
             # We're duplicating the file upload logic a little, which isn't great.
             resp = self._api.create_artifact_manifest(
                 "wandb_manifest.json",
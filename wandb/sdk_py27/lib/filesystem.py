@@ -12,3 +12,30 @@ def _safe_makedirs(dir_name):
         raise Exception("not dir")
     if not os.access(dir_name, os.W_OK):
         raise Exception("cant write: {}".format(dir_name))
+
+
+def _iter_files(root):
+    """Yields (path, size) for every file under root, following symlinks the
+    same way as os.walk(root, followlinks=True)."""
+    if not hasattr(os, "scandir"):
+        for dirpath, _, filenames in os.walk(root, followlinks=True):
+            for fname in filenames:
+                path = os.path.join(dirpath, fname)
+                yield path, os.path.getsize(path)
+        return
+
+    # DirEntry caches the file type read with the directory listing, so most
+    # entries are classified without an extra stat call, and its stat result
+    # is cached for the size.
+    dirs = [root]
+    while dirs:
+        try:
+            entries = list(os.scandir(dirs.pop()))
+        except OSError:
+            # os.walk silently skips directories it can't list.
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=True):
+                dirs.append(entry.path)
+            else:
+                yield entry.path, entry.stat(follow_symlinks=True).st_size
@@ -765,12 +765,18 @@ def has_num(dictionary, key):
     return key in dictionary and isinstance(dictionary[key], numbers.Number)
 
 
-def md5_file(path):
+def md5_hash_file(path):
     hash_md5 = hashlib.md5()
+    # We don't mmap the file: if another writer truncates it while we hash,
+    # touching the mapped pages kills the process with SIGBUS.
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             hash_md5.update(chunk)
-    return base64.b64encode(hash_md5.digest()).decode("ascii")
+    return hash_md5
+
+
+def md5_file(path):
+    return base64.b64encode(md5_hash_file(path).digest()).decode("ascii")
 
 
 def get_log_file_path():